@@ -1,15 +1,118 @@
+import asyncio
 import json
+import os
+import random
+import ssl
+import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from openai import OpenAI
 import requests
-from bs4 import BeautifulSoup
 import re
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse, parse_qs, urlsplit, urlunsplit
 import hashlib
-from config import MODEL_NAME, MAX_SEARCH_RESULTS, MAX_CONTENT_LENGTH, REQUEST_TIMEOUT, MAX_TOKENS
+from config import MODEL_NAME, MAX_SEARCH_RESULTS, MAX_CONTENT_LENGTH, MAX_FETCH_BYTES, REQUEST_TIMEOUT, MAX_TOKENS, SEARCH_CONCURRENCY
 import urllib3
 
+# Shared relaxed-SSL pool for problematic sites. Building the TLS-disabled
+# PoolManager once at import time means every fallback fetch reuses the same
+# SSL configuration and per-host connection pools instead of re-handshaking.
+# Advertise brotli only when a decoder is installed, otherwise gzip/deflate
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+# Cached per certificate path so repeated agent constructions don't re-stat
+# the bundle or rewrite os.environ
+_ssl_env_state: Dict[str, bool] = {}
+
+def _configure_ssl_env(ssl_cert_path: str) -> bool:
+    """Point the SSL environment variables at the bundle, once per path."""
+    if ssl_cert_path in _ssl_env_state:
+        return _ssl_env_state[ssl_cert_path]
+
+    exists = os.path.exists(ssl_cert_path)
+    if exists:
+        print(f"SSL certificate found at {ssl_cert_path}")
+        # Set environment variables for SSL
+        os.environ["SSL_CERT_FILE"] = ssl_cert_path
+        os.environ["REQUESTS_CA_BUNDLE"] = ssl_cert_path
+        print("SSL environment variables configured")
+    else:
+        print(f"WARNING: SSL certificate not found at {ssl_cert_path}")
+
+    _ssl_env_state[ssl_cert_path] = exists
+    return exists
+
+
+# Sites known to have SSL issues; compiled once so the per-URL check is a
+# single C-level scan rather than a Python substring loop
+_PROBLEMATIC_SITES = ['github.com', 'githubusercontent.com', 'td.com', 'tdbank.com']
+_PROBLEMATIC_SITES_RE = re.compile('|'.join(re.escape(site) for site in _PROBLEMATIC_SITES))
+
+# Collapses runs of whitespace in one C-level pass over the page text
+_WS_RE = re.compile(r'\s+')
+
+
+def _canonicalize_url(url: str) -> str:
+    """Normalize a URL so trivial variants map to one cache entry.
+
+    Lowercases the scheme and host, defaults an empty path to '/' and
+    drops the fragment - HTTPS://Example.com#top and https://example.com/
+    are the same resource and shouldn't cost two downloads.
+    """
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(),
+                       parts.path or '/', parts.query, ''))
+
+# Optional on-disk HTTP cache. CachedSession stores responses in sqlite and
+# replays stored ETag/Last-Modified validators on refetch, so unchanged pages
+# come back as cheap 304s instead of full downloads. Plain session otherwise.
+# Deliberately opt-in (not in requirements.txt): caching reads each miss's
+# body in full to store it, trading the streaming byte cap for cache hits -
+# worth it only for workloads that revisit the same URLs.
+try:
+    from requests_cache import CachedSession as _CachedSession
+except ImportError:
+    _CachedSession = None
+
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+_URLLIB3_POOL = urllib3.PoolManager(
+    cert_reqs='CERT_NONE',
+    assert_hostname=False,
+    ca_certs=None,  # Explicitly set to None
+    timeout=urllib3.Timeout(connect=REQUEST_TIMEOUT, read=REQUEST_TIMEOUT),
+    # Default per-host maxsize is 1; size it for the concurrent decomposed
+    # searches so parallel fallback fetches don't discard each other's
+    # keep-alive connections
+    maxsize=SEARCH_CONCURRENCY * 2
+)
+
+
+class _SSLContextAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter pinned to a single SSLContext.
+
+    Reusing one context lets OpenSSL cache TLS session tickets, so repeat
+    handshakes to the same host become abbreviated resumptions instead of
+    full exchanges.
+    """
+
+    def __init__(self, ssl_context=None, **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self._ssl_context is not None:
+            kwargs['ssl_context'] = self._ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        if self._ssl_context is not None:
+            kwargs['ssl_context'] = self._ssl_context
+        return super().proxy_manager_for(*args, **kwargs)
+
 
 class ResearchNote:
     def __init__(self, content: str, source_url: Optional[str] = None):
@@ -42,18 +145,52 @@ class ResearchAgent:
         self.notes: List[ResearchNote] = []
         self.sources: Dict[str, Dict[str, Any]] = {}  # url -> {content, title, timestamp}
         self.client = None
-        
-        # Setup SSL certificate
-        import os
-        if not os.path.exists(ssl_cert_path):
-            print(f"WARNING: SSL certificate not found at {ssl_cert_path}")
+        self._tools = None  # built lazily by get_tools and reused per message
+
+        # One browsing session reused across every page fetch, so repeat
+        # requests to a host keep their pooled TCP/TLS connection warm.
+        # Pools are sized for the concurrent decomposed searches so parallel
+        # requests don't evict each other's connections. When requests-cache
+        # is installed the session also persists responses on disk and
+        # answers unchanged URLs from cache (or a 304 revalidation).
+        if _CachedSession is not None:
+            self.session = _CachedSession(
+                '.web_cache',
+                backend='sqlite',
+                expire_after=REQUEST_TIMEOUT * 20,
+                cache_control=True,
+                stale_if_error=True,
+            )
         else:
-            print(f"SSL certificate found at {ssl_cert_path}")
-            # Set environment variables for SSL
-            os.environ["SSL_CERT_FILE"] = ssl_cert_path
-            os.environ["REQUESTS_CA_BUNDLE"] = ssl_cert_path
-            print("SSL environment variables configured")
-            
+            self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Encoding': _ACCEPT_ENCODING,
+        })
+        # Setup SSL certificate (no-op after the first agent for this path)
+        cert_ok = _configure_ssl_env(ssl_cert_path)
+
+        # Pin one SSLContext on the HTTPS adapter so TLS session tickets are
+        # cached and repeat handshakes to a host resume instead of restarting
+        try:
+            ssl_context = ssl.create_default_context(
+                cafile=ssl_cert_path if cert_ok else None
+            )
+        except ssl.SSLError as e:
+            print(f"Could not build SSL context from {ssl_cert_path}: {e}")
+            ssl_context = None
+
+        self.session.mount('https://', _SSLContextAdapter(
+            ssl_context=ssl_context,
+            pool_connections=SEARCH_CONCURRENCY,
+            pool_maxsize=SEARCH_CONCURRENCY * 2
+        ))
+        self.session.mount('http://', requests.adapters.HTTPAdapter(
+            pool_connections=SEARCH_CONCURRENCY,
+            pool_maxsize=SEARCH_CONCURRENCY * 2
+        ))
+
         self._init_client()
     
     def _init_client(self):
@@ -99,33 +236,31 @@ class ResearchAgent:
     
     def _is_problematic_site(self, url: str) -> bool:
         """Check if URL is known to have SSL issues."""
-        problematic_sites = ['github.com', 'githubusercontent.com', 'td.com', 'tdbank.com']
-        return any(site in url for site in problematic_sites)
+        return _PROBLEMATIC_SITES_RE.search(url) is not None
     
     def _fetch_with_urllib3(self, url: str) -> requests.Response:
         """Fetch URL using urllib3 with relaxed SSL validation."""
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-        
-        # Create a pool manager with completely disabled SSL verification
-        http = urllib3.PoolManager(
-            cert_reqs='CERT_NONE', 
-            assert_hostname=False,
-            ca_certs=None,  # Explicitly set to None
-            timeout=urllib3.Timeout(connect=REQUEST_TIMEOUT, read=REQUEST_TIMEOUT)
-        )
-        
         try:
-            response = http.request(
-                'GET', 
-                url, 
+            response = _URLLIB3_POOL.request(
+                'GET',
+                url,
                 headers={
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
                     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
                     'Accept-Language': 'en-US,en;q=0.5',
-                    'Accept-Encoding': 'gzip, deflate',
+                    'Accept-Encoding': _ACCEPT_ENCODING,
                     'Connection': 'keep-alive',
-                }
+                },
+                preload_content=False
             )
+            # Read at most the capped number of decoded bytes. A truncated
+            # read leaves unread body bytes on the socket, so the connection
+            # must be discarded rather than released back to the pool dirty
+            data = response.read(MAX_FETCH_BYTES)
+            if len(data) >= MAX_FETCH_BYTES:
+                response.close()
+            else:
+                response.release_conn()
             
             # Convert urllib3 response to requests-like response
             class FakeResponse:
@@ -139,7 +274,7 @@ class ResearchAgent:
                     self.content = data
                     self.headers = headers or {}
                     
-            return FakeResponse(response.data, response.status, response.headers)
+            return FakeResponse(data, response.status, response.headers)
         except Exception as e:
             print(f"urllib3 request failed: {e}")
             raise
@@ -150,18 +285,25 @@ class ResearchAgent:
             # For prototype, we'll use DuckDuckGo HTML search
             search_url = f"https://html.duckduckgo.com/html/?q={query}"
             
-            # DuckDuckGo doesn't typically have SSL issues, but use standard approach
-            response = requests.get(
+            # DuckDuckGo doesn't typically have SSL issues, but use standard
+            # approach; the shared session keeps its connection warm across
+            # the decomposed searches
+            response = self.session.get(
                 search_url,
-                headers={'User-Agent': 'Mozilla/5.0'},
                 verify=self.ssl_cert_path,
                 timeout=REQUEST_TIMEOUT
             )
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Imported lazily so cold starts that never parse HTML skip
+            # loading bs4/lxml; sys.modules makes repeat imports free
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(response.content, 'lxml')
             results = []
             
-            # Extract search results
+            # Extract search results; one timestamp covers the whole batch
+            # instead of re-formatting datetime.now() per result
+            fetched_at = datetime.now().isoformat()
+            seen_urls = set()
             for result in soup.find_all('div', class_='result')[:MAX_SEARCH_RESULTS]:
                 link_elem = result.find('a', class_='result__a')
                 snippet_elem = result.find('a', class_='result__snippet')
@@ -215,9 +357,16 @@ class ResearchAgent:
                             if url.startswith('//'):
                                 url = 'https:' + url
                     
+                    # Dedupe trivial variants of the same result URL so
+                    # they don't get scraped twice later
+                    url = _canonicalize_url(url)
+                    if url in seen_urls:
+                        continue
+                    seen_urls.add(url)
+
                     title = link_elem.get_text(strip=True)
                     snippet = snippet_elem.get_text(strip=True) if snippet_elem else ""
-                    
+
                     print(f"Found search result: {url}")
                     
                     results.append({
@@ -230,7 +379,7 @@ class ResearchAgent:
                     self.sources[url] = {
                         'title': title,
                         'snippet': snippet,
-                        'timestamp': datetime.now().isoformat(),
+                        'timestamp': fetched_at,
                         'query': query
                     }
             
@@ -247,9 +396,109 @@ class ResearchAgent:
                 'query': query
             }
     
+    def _get_with_retries(self, url: str, max_attempts: int = 3) -> requests.Response:
+        """GET through the shared session, retrying transient failures.
+
+        Retries use exponential backoff with jitter, bounded by an overall
+        deadline so one flaky URL can't stall a research turn. SSL and
+        connection errors propagate immediately - the urllib3 fallback in
+        fetch_page_content handles those.
+        """
+        deadline = time.monotonic() + REQUEST_TIMEOUT * 3
+        for attempt in range(1, max_attempts + 1):
+            try:
+                response = self.session.get(
+                    url,
+                    verify=self.ssl_cert_path,
+                    timeout=REQUEST_TIMEOUT,
+                    allow_redirects=True,
+                    stream=True
+                )
+                if response.status_code >= 500 and attempt < max_attempts:
+                    response.close()
+                    raise requests.exceptions.RetryError(f"HTTP {response.status_code}")
+
+                # Stream the body and stop at the cap - only a few thousand
+                # characters of text survive parsing, so there's no point
+                # downloading a multi-megabyte page in full
+                parts = []
+                received = 0
+                for chunk in response.iter_content(chunk_size=65536):
+                    parts.append(chunk)
+                    received += len(chunk)
+                    if received >= MAX_FETCH_BYTES:
+                        break
+                response.close()
+                response._content = b''.join(parts)
+                return response
+            except (requests.exceptions.SSLError, requests.exceptions.ConnectionError):
+                raise
+            except requests.exceptions.RequestException as e:
+                wait = 0.5 * (2 ** (attempt - 1))
+                wait += random.uniform(0, wait / 2)
+                if attempt == max_attempts or time.monotonic() + wait > deadline:
+                    raise
+                print(f"Transient error fetching {url}: {e}; retrying in {wait:.1f}s")
+                time.sleep(wait)
+
+    def _clean_page_text(self, soup) -> str:
+        """Extract cleaned page text, capped at MAX_CONTENT_LENGTH.
+
+        Whitespace collapse runs as a single precompiled-regex pass in the
+        regex engine instead of Python-level split/strip/join over every
+        line; fetches are already byte-capped, so one pass stays cheap.
+        """
+        text = _WS_RE.sub(' ', soup.get_text()).strip()
+        if len(text) > MAX_CONTENT_LENGTH:
+            text = text[:MAX_CONTENT_LENGTH] + "..."
+        return text
+
+    def _parse_page(self, response, url: str) -> Dict[str, Any]:
+        """Parse a fetched response into title, capped text and validators.
+
+        Single parse pass shared by the primary and SSL-fallback paths,
+        which used to carry duplicate copies of this block.
+        """
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(response.content, 'lxml')
+
+        # Remove script and style elements
+        for script in soup(['script', 'style']):
+            script.decompose()
+
+        # Extract text up to the content cap
+        text = self._clean_page_text(soup)
+
+        # Extract title
+        title = soup.find('title')
+        title_text = title.get_text(strip=True) if title else urlparse(url).netloc
+
+        return {
+            'title': title_text,
+            'content': text,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        }
+
     def fetch_page_content(self, url: str) -> Dict[str, Any]:
         """Fetch and parse content from a specific URL"""
         try:
+            # Canonicalize first so URL variants share one cache entry
+            # and one download
+            url = _canonicalize_url(url)
+
+            # Serve repeat requests from the session cache instead of
+            # re-fetching and re-parsing the same page
+            cached = self.sources.get(url)
+            if cached and 'content' in cached:
+                print(f"Using cached content for: {url}")
+                return {
+                    'success': True,
+                    'url': url,
+                    'title': cached['title'],
+                    'content': cached['content']
+                }
+
             # Check if URL is a PDF
             if url.lower().endswith('.pdf'):
                 print(f"Detected PDF URL: {url}")
@@ -268,96 +517,55 @@ class ResearchAgent:
             else:
                 # Try with proper SSL first
                 try:
-                    # Create a session with SSL adapter
-                    session = requests.Session()
-                    session.headers.update({
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    })
-                    
-                    response = session.get(
-                        url,
-                        verify=self.ssl_cert_path,
-                        timeout=REQUEST_TIMEOUT,
-                        allow_redirects=True
-                    )
+                    response = self._get_with_retries(url)
                 except (requests.exceptions.SSLError, requests.exceptions.ConnectionError) as e:
                     # If SSL fails, try without verification
                     print(f"SSL/Connection error for {url}: {e}")
                     print("Trying with urllib3 fallback...")
                     response = self._fetch_with_urllib3(url)
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(['script', 'style']):
-                script.decompose()
-            
-            # Extract text
-            text = soup.get_text()
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = ' '.join(chunk for chunk in chunks if chunk)
-            
-            # Limit text length
-            text = text[:MAX_CONTENT_LENGTH] + "..." if len(text) > MAX_CONTENT_LENGTH else text
-            
-            # Extract title
-            title = soup.find('title')
-            title_text = title.get_text(strip=True) if title else urlparse(url).netloc
-            
-            # Update source with full content
+            parsed = self._parse_page(response, url)
+
+            # Update source with full content, keeping the cache validators
+            # so a later conditional refetch can answer 304 Not Modified
             self.sources[url] = {
-                'title': title_text,
-                'content': text,
+                'title': parsed['title'],
+                'content': parsed['content'],
                 'timestamp': datetime.now().isoformat(),
-                'url': url
+                'url': url,
+                'etag': parsed['etag'],
+                'last_modified': parsed['last_modified']
             }
-            
+
             return {
                 'success': True,
                 'url': url,
-                'title': title_text,
-                'content': text
+                'title': parsed['title'],
+                'content': parsed['content']
             }
-            
+
         except requests.exceptions.SSLError as e:
             print(f"SSL Error fetching {url}: {e}")
             print("Retrying with urllib3 fallback...")
             try:
                 response = self._fetch_with_urllib3(url)
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Remove script and style elements
-                for script in soup(['script', 'style']):
-                    script.decompose()
-                
-                # Extract text
-                text = soup.get_text()
-                lines = (line.strip() for line in text.splitlines())
-                chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                text = ' '.join(chunk for chunk in chunks if chunk)
-                
-                # Limit text length
-                text = text[:MAX_CONTENT_LENGTH] + "..." if len(text) > MAX_CONTENT_LENGTH else text
-                
-                # Extract title
-                title = soup.find('title')
-                title_text = title.get_text(strip=True) if title else urlparse(url).netloc
-                
-                # Update source with full content
+                parsed = self._parse_page(response, url)
+
+                # Update source with full content, keeping the cache validators
                 self.sources[url] = {
-                    'title': title_text,
-                    'content': text,
+                    'title': parsed['title'],
+                    'content': parsed['content'],
                     'timestamp': datetime.now().isoformat(),
-                    'url': url
+                    'url': url,
+                    'etag': parsed['etag'],
+                    'last_modified': parsed['last_modified']
                 }
-                
+
                 return {
                     'success': True,
                     'url': url,
-                    'title': title_text,
-                    'content': text
+                    'title': parsed['title'],
+                    'content': parsed['content']
                 }
             except Exception as e2:
                 print(f"urllib3 fallback also failed: {e2}")
@@ -418,7 +626,6 @@ Example for "Big 6 Canadian banks net income":
             )
             
             # Parse the JSON response
-            import json
             try:
                 search_items = json.loads(response.choices[0].message.content.strip())
                 
@@ -501,6 +708,74 @@ Format your summary with natural source attribution so readers know where each p
                 'error': f"Summarization failed: {str(e)}"
             }
     
+    def summarize_search_batches(self, search_batches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Summarize the results of several searches in a single LLM call"""
+        batches = [b for b in search_batches if b.get('results')]
+        if not batches:
+            return []
+
+        try:
+            content_text = ""
+            for i, batch in enumerate(batches):
+                content_text += f"\n--- SEARCH {i+1} ---\n"
+                content_text += f"Query: {batch['query']}\nPurpose: {batch['purpose']}\nResults:\n"
+                for j, result in enumerate(batch['results'][:5]):  # Limit to top 5 results
+                    content_text += f"\n{j+1}. {result.get('title', 'No title')}\n"
+                    content_text += f"   {result.get('snippet', 'No snippet')}\n"
+                    content_text += f"   URL: {result.get('url', 'No URL')}\n"
+
+            batch_prompt = f"""
+Analyze and summarize the results of the following {len(batches)} searches.
+{content_text}
+
+For EACH search, provide a comprehensive summary that:
+1. Extracts key information relevant to the search purpose
+2. Identifies specific data points, numbers, dates
+3. IMPORTANT: When mentioning information, include the source by referencing the article title or website name
+   - Example: "According to Reuters' article 'TD Bank Posts Q2 Profits', the bank reported..."
+4. Notes any conflicting information or uncertainties
+5. Groups related information from multiple sources
+
+Return ONLY a JSON array with one object per search, in the same order:
+[
+  {{"search": 1, "summary": "..."}},
+  {{"search": 2, "summary": "..."}}
+]
+"""
+
+            messages = [{"role": "user", "content": batch_prompt}]
+            response = self.client.chat.completions.create(
+                model=MODEL_NAME,
+                messages=messages,
+                max_tokens=min(800 * len(batches), MAX_TOKENS),
+                temperature=0.2
+            )
+
+            parsed = json.loads(response.choices[0].message.content.strip())
+            if isinstance(parsed, list) and len(parsed) == len(batches):
+                summaries = []
+                for batch, item in zip(batches, parsed):
+                    summary = item.get('summary', '') if isinstance(item, dict) else str(item)
+                    summaries.append({
+                        'success': True,
+                        'search_query': batch['query'],
+                        'search_purpose': batch['purpose'],
+                        'summary': str(summary).strip(),
+                        'source_count': len(batch['results'])
+                    })
+                return summaries
+            print("Batch summary shape didn't match searches, falling back to per-search calls")
+        except Exception as e:
+            print(f"Batch summarization failed: {e}")
+
+        # Fallback: summarize each search individually
+        summaries = []
+        for batch in batches:
+            summary_result = self.summarize_search_results(batch['query'], batch['purpose'], batch['results'])
+            if summary_result.get('success'):
+                summaries.append(summary_result)
+        return summaries
+
     def take_note(self, content: str, source_url: Optional[str] = None) -> Dict[str, Any]:
         """Store a research note"""
         note = ResearchNote(content, source_url)
@@ -514,7 +789,9 @@ Format your summary with natural source attribution so readers know where each p
     
     def get_tools(self) -> List[Dict[str, Any]]:
         """Return tool definitions for the LLM"""
-        return [
+        if self._tools is not None:
+            return self._tools
+        self._tools = [
             {
                 "type": "function",
                 "function": {
@@ -593,7 +870,8 @@ Format your summary with natural source attribution so readers know where each p
                 }
             }
         ]
-    
+        return self._tools
+
     def execute_tool(self, tool_name: str, arguments: Dict[str, Any], status_callback=None) -> Dict[str, Any]:
         """Execute a tool call"""
         if tool_name == "decompose_query":
@@ -771,6 +1049,21 @@ CRITICAL: If you see words like "Big 6", "major banks", "top companies", "compar
         self.notes.clear()
         self.sources.clear()
     
+    async def _stream_chunks(self, stream):
+        """Yield chunks from a blocking OpenAI stream without stalling the event loop.
+
+        The OpenAI SDK stream is a synchronous iterator, so each network read
+        is pushed onto a worker thread; the websocket sends queued by the
+        status callback can flush while the next chunk is in flight.
+        """
+        iterator = iter(stream)
+        sentinel = object()
+        while True:
+            chunk = await asyncio.to_thread(next, iterator, sentinel)
+            if chunk is sentinel:
+                break
+            yield chunk
+
     async def process_message_stream(self, user_message: str, status_callback=None):
         """Process a user message and stream the response"""
         try:
@@ -885,23 +1178,35 @@ CRITICAL: If you see words like "Big 6", "major banks", "top companies", "compar
                     if tool_name == "decompose_query" and result.get('success') and result.get('execute_searches'):
                         search_summaries = []
                         all_search_results = []
-                        
-                        for search_item in result.get('search_items', []):
+
+                        # Run the decomposed searches concurrently; a semaphore
+                        # keeps us from hammering the search engine all at once
+                        semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
+
+                        async def run_search(search_item):
                             query = search_item.get('query', '')
                             purpose = search_item.get('purpose', 'research')
-                            
+
                             # Show individual search progress
                             if status_callback:
                                 await status_callback('tool_use', {
                                     'tool': 'search_web',
                                     'arguments': {'query': f"{query} ({purpose})"}
                                 })
-                            
-                            # Execute the search
-                            search_result = self.search_web(query)
+
+                            async with semaphore:
+                                search_result = await asyncio.to_thread(self.search_web, query)
+                            return query, purpose, search_result
+
+                        search_outcomes = await asyncio.gather(
+                            *(run_search(item) for item in result.get('search_items', []))
+                        )
+
+                        search_batches = []
+                        for query, purpose, search_result in search_outcomes:
                             if search_result.get('success'):
                                 search_results = search_result.get('results', [])
-                                
+
                                 # Collect sources
                                 for search_item_result in search_results:
                                     all_search_results.append(search_item_result)
@@ -910,12 +1215,19 @@ CRITICAL: If you see words like "Big 6", "major banks", "top companies", "compar
                                         'title': search_item_result['title'],
                                         'type': f'decomposed_search_{purpose}'
                                     })
-                                
-                                # Summarize the search results
-                                print(f"Summarizing results for: {query}")
-                                summary_result = self.summarize_search_results(query, purpose, search_results)
-                                if summary_result.get('success'):
-                                    search_summaries.append(summary_result)
+
+                                search_batches.append({
+                                    'query': query,
+                                    'purpose': purpose,
+                                    'results': search_results
+                                })
+
+                        # Summarize all searches in one LLM round trip
+                        if search_batches:
+                            print(f"Summarizing {len(search_batches)} searches in one batch...")
+                            search_summaries = await asyncio.to_thread(
+                                self.summarize_search_batches, search_batches
+                            )
                         
                         # Update the tool result to include summaries and all search results
                         result['search_summaries'] = search_summaries
@@ -953,13 +1265,13 @@ CRITICAL: If you see words like "Big 6", "major banks", "top companies", "compar
                 )
                 
                 full_response = ""
-                for chunk in stream:
+                async for chunk in self._stream_chunks(stream):
                     if chunk.choices and len(chunk.choices) > 0 and chunk.choices[0].delta.content:
                         content = chunk.choices[0].delta.content
                         full_response += content
                         if status_callback:
                             await status_callback('stream_chunk', {'content': content})
-                
+
                 # Send completion with collected sources
                 if status_callback:
                     await status_callback('complete', {
@@ -979,13 +1291,13 @@ CRITICAL: If you see words like "Big 6", "major banks", "top companies", "compar
                 )
                 
                 full_response = ""
-                for chunk in stream:
+                async for chunk in self._stream_chunks(stream):
                     if chunk.choices and len(chunk.choices) > 0 and chunk.choices[0].delta.content:
                         content = chunk.choices[0].delta.content
                         full_response += content
                         if status_callback:
                             await status_callback('stream_chunk', {'content': content})
-                
+
                 if status_callback:
                     await status_callback('complete', {
                         'response': full_response,
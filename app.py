@@ -32,6 +32,10 @@ app.add_middleware(
 # Global agent instance (in production, use proper session management)
 agent = None
 
+# Checked once at startup; the certificate bundle doesn't change while the
+# server runs, so health checks shouldn't re-stat it on every ping
+SSL_CERT_EXISTS = os.path.exists(SSL_CERT_PATH)
+
 def get_agent():
     global agent
     if agent is None:
@@ -40,7 +44,7 @@ def get_agent():
             agent = ResearchAgent(OAUTH_CONFIG, SSL_CERT_PATH)
             logger.info("ResearchAgent initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize ResearchAgent: {e}")
+            logger.error("Failed to initialize ResearchAgent: %s", e)
             raise
     return agent
 
@@ -58,7 +62,7 @@ async def health_check():
         return {
             "status": "healthy",
             "model": MODEL_NAME,
-            "ssl_cert_exists": os.path.exists(SSL_CERT_PATH),
+            "ssl_cert_exists": SSL_CERT_EXISTS,
             "config_loaded": True
         }
     except Exception as e:
@@ -66,7 +70,7 @@ async def health_check():
             "status": "unhealthy",
             "error": str(e),
             "model": MODEL_NAME,
-            "ssl_cert_exists": os.path.exists(SSL_CERT_PATH)
+            "ssl_cert_exists": SSL_CERT_EXISTS
         }
 
 
@@ -120,7 +124,7 @@ async def websocket_endpoint(websocket: WebSocket):
                     await agent.process_message_stream(user_message, status_callback)
                     
                 except Exception as e:
-                    logger.error(f"Error processing message: {e}")
+                    logger.error("Error processing message: %s", e)
                     await websocket.send_text(json.dumps({
                         'type': 'error',
                         'message': str(e)
@@ -134,7 +138,7 @@ async def websocket_endpoint(websocket: WebSocket):
                 }))
                 
     except Exception as e:
-        logger.error(f"WebSocket error: {e}")
+        logger.error("WebSocket error: %s", e)
     finally:
         logger.info("WebSocket connection closed")
 
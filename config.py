@@ -28,4 +28,6 @@ WS_RECONNECT_INTERVAL = 3000  # milliseconds
 # Research Configuration
 MAX_SEARCH_RESULTS = 5
 MAX_CONTENT_LENGTH = 3000
-REQUEST_TIMEOUT = 10  # seconds
\ No newline at end of file
+MAX_FETCH_BYTES = 512 * 1024  # stop downloading page bodies beyond this
+REQUEST_TIMEOUT = 10  # seconds
+SEARCH_CONCURRENCY = 3  # parallel searches for decomposed queries
\ No newline at end of file
@@ -59,5 +59,14 @@ print("-" * 50)
 import uvicorn
 from app import app
 
+# uvloop is a drop-in, faster asyncio event loop; uvicorn picks it up
+# automatically when installed, this just covers non-uvicorn asyncio use.
+# Optional - not available on Windows.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 if __name__ == "__main__":
     uvicorn.run(app, host=SERVER_HOST, port=SERVER_PORT)
\ No newline at end of file
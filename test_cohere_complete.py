@@ -8,13 +8,23 @@ Replicates the iris-project authentication flow:
 4. Test streaming and tool calling
 """
 
+import asyncio
+import functools
 import os
+import random
 import requests
 import time
 import logging
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+# orjson decodes the token response from raw bytes without the charset
+# detection and dict overhead of response.json(); optional, stdlib fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -36,6 +46,7 @@ CONFIG = {
     "REQUEST_TIMEOUT": 180,
     "MAX_RETRY_ATTEMPTS": 3,
     "RETRY_DELAY_SECONDS": 2,
+    "OAUTH_HEDGE_DELAY_SECONDS": 2.0,
     "TOKEN_PREVIEW_LENGTH": 7,
     
     # Model Configuration
@@ -43,33 +54,116 @@ CONFIG = {
     "MODEL_LARGE": "gpt-4o-2024-05-13",
 }
 
+# Hot values hoisted out of CONFIG once at import so the retry and test
+# loops don't repeat the dict lookups
+REQUEST_TIMEOUT = CONFIG["REQUEST_TIMEOUT"]
+MAX_RETRY_ATTEMPTS = CONFIG["MAX_RETRY_ATTEMPTS"]
+RETRY_DELAY_SECONDS = CONFIG["RETRY_DELAY_SECONDS"]
+OAUTH_HEDGE_DELAY_SECONDS = CONFIG["OAUTH_HEDGE_DELAY_SECONDS"]
+TOKEN_PREVIEW_LENGTH = CONFIG["TOKEN_PREVIEW_LENGTH"]
+MODEL_SMALL = CONFIG["MODEL_SMALL"]
+
+# Shared test payload: built once at import instead of per call
+WEATHER_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "get_weather",
+            "description": "Get the current weather for a location",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "location": {
+                        "type": "string",
+                        "description": "The city and state/country"
+                    }
+                },
+                "required": ["location"]
+            }
+        }
+    }
+]
+
+# Module-level session so OAuth retries reuse one pooled TCP/TLS connection
+# instead of re-handshaking on every attempt
+SESSION = requests.Session()
+
+# One OpenAI client shared by all tests so they reuse the same token and
+# HTTP connection pool instead of rebuilding both per test
+_client = None
+
+def get_client(oauth_token: str):
+    """Build the OpenAI client once and reuse it across all tests."""
+    global _client
+    if _client is None:
+        from openai import OpenAI
+        _client = OpenAI(
+            api_key=oauth_token,
+            base_url=CONFIG["BASE_URL"]
+        )
+    return _client
+
+@functools.lru_cache(maxsize=None)
 def setup_ssl() -> Optional[str]:
-    """Setup SSL certificate like iris-project does."""
+    """Setup SSL certificate like iris-project does.
+
+    Memoized so repeat calls skip the path build, the filesystem stat and
+    the environment rewrites.
+    """
     script_dir = Path(__file__).parent
     cert_path = script_dir / "ssl_certs" / CONFIG["SSL_CERT_FILENAME"]
     
     if cert_path.exists():
-        logger.info(f"Found SSL certificate: {cert_path}")
+        logger.info("Found SSL certificate: %s", cert_path)
         # Set environment variables like iris-project
         os.environ["SSL_CERT_FILE"] = str(cert_path)
         os.environ["REQUESTS_CA_BUNDLE"] = str(cert_path)
         logger.info("SSL environment configured successfully")
         return str(cert_path)
     else:
-        logger.warning(f"SSL certificate not found at {cert_path}")
+        logger.warning("SSL certificate not found at %s", cert_path)
         logger.warning("Proceeding without custom SSL certificate")
         return None
 
-def setup_oauth() -> str:
-    """Get OAuth token using client credentials flow like iris-project."""
+async def _hedged_token_post(payload: Dict[str, str]):
+    """POST to the token endpoint, hedging against a slow primary request.
+
+    If the first request hasn't completed within OAUTH_HEDGE_DELAY_SECONDS,
+    a backup request is fired and whichever finishes first wins - this cuts
+    tail latency when the endpoint occasionally stalls. Client-credential
+    token requests are idempotent, so the duplicate is safe.
+    """
+    def post():
+        return SESSION.post(CONFIG["OAUTH_URL"], data=payload, timeout=REQUEST_TIMEOUT)
+
+    primary = asyncio.create_task(asyncio.to_thread(post))
+    done, _ = await asyncio.wait({primary}, timeout=OAUTH_HEDGE_DELAY_SECONDS)
+    if not done:
+        logger.info("Primary OAuth request is slow, sending hedged backup...")
+        backup = asyncio.create_task(asyncio.to_thread(post))
+        done, pending = await asyncio.wait({primary, backup}, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        # Prefer a request that completed without raising
+        for task in done:
+            if task.exception() is None:
+                return task.result()
+    return done.pop().result()
+
+async def setup_oauth() -> str:
+    """Get OAuth token using client credentials flow like iris-project.
+
+    Async so retry waits yield the event loop instead of blocking it; the
+    actual POST runs on a worker thread.
+    """
     logger.info("Starting OAuth authentication...")
     
     # Validate settings
     if not all([CONFIG["OAUTH_URL"], CONFIG["OAUTH_CLIENT_ID"], CONFIG["OAUTH_CLIENT_SECRET"]]):
         raise ValueError("Missing required OAuth settings: URL, client ID, or client secret")
     
-    logger.info(f"OAuth URL: {CONFIG['OAUTH_URL']}")
-    logger.info(f"Client ID: {CONFIG['OAUTH_CLIENT_ID'][:4]}****")
+    logger.info("OAuth URL: %s", CONFIG['OAUTH_URL'])
+    logger.info("Client ID: %s****", CONFIG['OAUTH_CLIENT_ID'][:4])
     
     payload = {
         "grant_type": "client_credentials",
@@ -80,24 +174,23 @@ def setup_oauth() -> str:
     attempts = 0
     start_time = time.time()
     
-    while attempts < CONFIG["MAX_RETRY_ATTEMPTS"]:
+    while attempts < MAX_RETRY_ATTEMPTS:
         attempts += 1
         attempt_start = time.time()
         
         try:
-            logger.info(f"OAuth attempt {attempts}/{CONFIG['MAX_RETRY_ATTEMPTS']}")
+            logger.info("OAuth attempt %s/%s", attempts, MAX_RETRY_ATTEMPTS)
             
-            response = requests.post(
-                CONFIG["OAUTH_URL"], 
-                data=payload, 
-                timeout=CONFIG["REQUEST_TIMEOUT"]
-            )
+            response = await _hedged_token_post(payload)
             response.raise_for_status()
             
             attempt_time = time.time() - attempt_start
-            logger.info(f"OAuth response received in {attempt_time:.2f} seconds")
+            logger.info("OAuth response received in %.2f seconds", attempt_time)
             
-            token_data = response.json()
+            if orjson is not None:
+                token_data = orjson.loads(response.content)
+            else:
+                token_data = response.json()
             token = token_data.get("access_token")
             
             if not token:
@@ -105,67 +198,75 @@ def setup_oauth() -> str:
             
             # Create token preview for logging
             token_preview = (
-                token[:CONFIG["TOKEN_PREVIEW_LENGTH"]] + "..."
-                if len(token) > CONFIG["TOKEN_PREVIEW_LENGTH"]
+                token[:TOKEN_PREVIEW_LENGTH] + "..."
+                if len(token) > TOKEN_PREVIEW_LENGTH
                 else token
             )
-            logger.info(f"Successfully obtained OAuth token: {token_preview}")
+            logger.info("Successfully obtained OAuth token: %s", token_preview)
             
             total_time = time.time() - start_time
-            logger.info(f"OAuth completed in {total_time:.2f} seconds after {attempts} attempt(s)")
+            logger.info("OAuth completed in %.2f seconds after %s attempt(s)", total_time, attempts)
             
             return str(token)
             
         except Exception as e:
             attempt_time = time.time() - attempt_start
-            logger.warning(f"OAuth attempt {attempts} failed after {attempt_time:.2f} seconds: {e}")
-            
-            if attempts < CONFIG["MAX_RETRY_ATTEMPTS"]:
-                logger.info(f"Retrying in {CONFIG['RETRY_DELAY_SECONDS']} seconds...")
-                time.sleep(CONFIG["RETRY_DELAY_SECONDS"])
+            logger.warning("OAuth attempt %s failed after %.2f seconds: %s", attempts, attempt_time, e)
+
+            # Client errors (bad credentials, bad request) won't fix
+            # themselves - fail fast instead of burning retries. 429 is the
+            # one 4xx worth retrying.
+            if isinstance(e, requests.exceptions.HTTPError) and e.response is not None:
+                status = e.response.status_code
+                if 400 <= status < 500 and status != 429:
+                    logger.error("HTTP %s is not retryable, aborting OAuth", status)
+                    raise
+
+            if attempts < MAX_RETRY_ATTEMPTS:
+                # Exponential backoff with jitter so repeated attempts back
+                # off quickly without synchronizing against the endpoint
+                delay = RETRY_DELAY_SECONDS * (2 ** (attempts - 1))
+                delay += random.uniform(0, delay / 2)
+                logger.info("Retrying in %.1f seconds...", delay)
+                await asyncio.sleep(delay)
     
     raise Exception(f"Failed to obtain OAuth token after {attempts} attempts")
 
 def test_openai_client(oauth_token: str) -> bool:
     """Test OpenAI client connection like iris-project."""
     try:
-        from openai import OpenAI
-        
         logger.info("Testing OpenAI client connection...")
-        
+
         # Create client like iris-project does
-        client = OpenAI(
-            api_key=oauth_token,
-            base_url=CONFIG["BASE_URL"]
-        )
-        
+        client = get_client(oauth_token)
+
         # Log connection details
         token_preview = (
-            oauth_token[:CONFIG["TOKEN_PREVIEW_LENGTH"]] + "..."
-            if len(oauth_token) > CONFIG["TOKEN_PREVIEW_LENGTH"]
+            oauth_token[:TOKEN_PREVIEW_LENGTH] + "..."
+            if len(oauth_token) > TOKEN_PREVIEW_LENGTH
             else oauth_token
         )
-        logger.info(f"Using OAuth token: {token_preview}")
-        logger.info(f"Using API base URL: {CONFIG['BASE_URL']}")
+        logger.info("Using OAuth token: %s", token_preview)
+        logger.info("Using API base URL: %s", CONFIG['BASE_URL'])
         
         # Simple test call
         messages = [{"role": "user", "content": "Hello! Please respond with exactly: 'Connection successful'"}]
         
         logger.info("Making test API call...")
         response = client.chat.completions.create(
-            model=CONFIG["MODEL_SMALL"],
+            model=MODEL_SMALL,
             messages=messages,
-            timeout=CONFIG["REQUEST_TIMEOUT"]
+            timeout=REQUEST_TIMEOUT
         )
         
         if response and response.choices:
             content = response.choices[0].message.content
-            logger.info(f"API Response: {content}")
+            logger.info("API Response: %s", content)
             
             # Log usage if available
             if hasattr(response, 'usage') and response.usage:
-                logger.info(f"Token usage - Prompt: {response.usage.prompt_tokens}, "
-                          f"Completion: {response.usage.completion_tokens}")
+                logger.info("Token usage - Prompt: %s, Completion: %s",
+                          response.usage.prompt_tokens, response.usage.completion_tokens)
             
             return "successful" in content.lower()
         else:
@@ -173,97 +274,73 @@ def test_openai_client(oauth_token: str) -> bool:
             return False
             
     except Exception as e:
-        logger.error(f"OpenAI client test failed: {e}")
+        logger.error("OpenAI client test failed: %s", e)
         return False
 
 def test_streaming(oauth_token: str) -> bool:
     """Test streaming response like iris-project."""
     try:
-        from openai import OpenAI
-        
         logger.info("Testing streaming response...")
-        
-        client = OpenAI(
-            api_key=oauth_token,
-            base_url=CONFIG["BASE_URL"]
-        )
-        
+
+        client = get_client(oauth_token)
+
         messages = [{"role": "user", "content": "Count from 1 to 5, one number per line."}]
         
         stream = client.chat.completions.create(
-            model=CONFIG["MODEL_SMALL"],
+            model=MODEL_SMALL,
             messages=messages,
             stream=True,
-            timeout=CONFIG["REQUEST_TIMEOUT"]
+            timeout=REQUEST_TIMEOUT
         )
         
         chunks_received = 0
         content_chunks = []
         
+        # Keep the per-chunk loop minimal: the SDK already consumes the SSE
+        # byte stream internally, so the only Python-level work per chunk
+        # should be the delta append and the bail-out check
+        last_chunk = None
         for chunk in stream:
             chunks_received += 1
             if chunk.choices and chunk.choices[0].delta.content:
                 content_chunks.append(chunk.choices[0].delta.content)
-            
-            # Cohere models don't provide usage in stream chunks
-            # Just log chunk info occasionally
-            if chunks_received % 10 == 0:
-                logger.info(f"Received {chunks_received} chunks so far...")
-            
+            last_chunk = chunk
+
             # Reasonable limit
             if chunks_received > 50:
                 break
-        
+
         full_content = ''.join(content_chunks)
-        logger.info(f"Streaming test - received {chunks_received} chunks")
-        logger.info(f"Content preview: {full_content[:100]}...")
+        logger.info("Streaming test - received %s chunks", chunks_received)
+        logger.info("Content preview: %s...", full_content[:100])
+
+        # Usage, when the backend reports it at all, arrives on the terminal
+        # chunk - check once here rather than polling inside the loop
+        usage = getattr(last_chunk, 'usage', None)
+        if usage:
+            logger.info("Stream token usage - Prompt: %s, Completion: %s",
+                        usage.prompt_tokens, usage.completion_tokens)
         
         return chunks_received > 1
         
     except Exception as e:
-        logger.error(f"Streaming test failed: {e}")
+        logger.error("Streaming test failed: %s", e)
         return False
 
 def test_tool_calling(oauth_token: str) -> bool:
     """Test tool calling functionality."""
     try:
-        from openai import OpenAI
-        
         logger.info("Testing tool calling...")
-        
-        client = OpenAI(
-            api_key=oauth_token,
-            base_url=CONFIG["BASE_URL"]
-        )
-        
-        # Define a simple test tool
-        tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_weather",
-                    "description": "Get the current weather for a location",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "location": {
-                                "type": "string",
-                                "description": "The city and state/country"
-                            }
-                        },
-                        "required": ["location"]
-                    }
-                }
-            }
-        ]
-        
+
+        client = get_client(oauth_token)
+
         messages = [{"role": "user", "content": "What's the weather like in Toronto?"}]
         
         response = client.chat.completions.create(
-            model=CONFIG["MODEL_SMALL"],
+            model=MODEL_SMALL,
             messages=messages,
-            tools=tools,
-            timeout=CONFIG["REQUEST_TIMEOUT"]
+            tools=WEATHER_TOOLS,
+            timeout=REQUEST_TIMEOUT
         )
         
         if response and response.choices:
@@ -271,21 +348,21 @@ def test_tool_calling(oauth_token: str) -> bool:
             
             # Check for tool calls
             if hasattr(message, 'tool_calls') and message.tool_calls:
-                logger.info(f"Tool calls detected: {len(message.tool_calls)}")
+                logger.info("Tool calls detected: %s", len(message.tool_calls))
                 for tool_call in message.tool_calls:
-                    logger.info(f"Tool: {tool_call.function.name}, Args: {tool_call.function.arguments}")
+                    logger.info("Tool: %s, Args: %s", tool_call.function.name, tool_call.function.arguments)
                 return True
             else:
-                logger.info(f"No tool calls detected. Response: {message.content[:100]}...")
+                logger.info("No tool calls detected. Response: %s...", message.content[:100])
                 return False
         
         return False
         
     except Exception as e:
-        logger.error(f"Tool calling test failed: {e}")
+        logger.error("Tool calling test failed: %s", e)
         return False
 
-def main():
+async def main():
     print("=" * 60)
     print("COMPLETE COHERE MODEL TEST")
     print("=" * 60)
@@ -305,22 +382,23 @@ def main():
         # Step 2: OAuth Authentication
         print("\nSTEP 2: OAUTH AUTHENTICATION")
         print("-" * 30)
-        oauth_token = setup_oauth()
-        
-        # Step 3: Test OpenAI Client
-        print("\nSTEP 3: OPENAI CLIENT TEST")
-        print("-" * 30)
-        basic_success = test_openai_client(oauth_token)
-        
-        # Step 4: Test Streaming
-        print("\nSTEP 4: STREAMING TEST")
-        print("-" * 30)
-        streaming_success = test_streaming(oauth_token)
+        oauth_token = await setup_oauth()
         
-        # Step 5: Test Tool Calling
-        print("\nSTEP 5: TOOL CALLING TEST")
+        # Steps 3-5: the three API tests are independent of each other,
+        # so run them concurrently instead of back to back
+        print("\nSTEPS 3-5: API TESTS (CONCURRENT)")
         print("-" * 30)
-        tools_success = test_tool_calling(oauth_token)
+        print("Running basic connection, streaming and tool calling in parallel...")
+
+        # Warm the shared client up front so the worker threads don't race
+        # to create it
+        get_client(oauth_token)
+
+        basic_success, streaming_success, tools_success = await asyncio.gather(
+            asyncio.to_thread(test_openai_client, oauth_token),
+            asyncio.to_thread(test_streaming, oauth_token),
+            asyncio.to_thread(test_tool_calling, oauth_token),
+        )
         
         # Summary
         print("\n" + "=" * 60)
@@ -355,7 +433,7 @@ def main():
             print("  Check configuration and network connectivity.")
             
     except Exception as e:
-        logger.error(f"Test failed with error: {e}")
+        logger.error("Test failed with error: %s", e)
         print(f"\n✗ FAILED: {e}")
         print("\nTroubleshooting:")
         print("1. Update CONFIG section with your actual endpoints and credentials")
@@ -363,4 +441,4 @@ def main():
         print("3. Check network connectivity and OAuth configuration")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -5,7 +5,10 @@ Tests external website connectivity with smart SSL handling for enterprise envir
 Put your rbc-ca-bundle.cer file in the ssl_certs/ folder and run this script.
 """
 
+import asyncio
+import functools
 import os
+import re
 import requests
 import urllib3
 import logging
@@ -15,16 +18,50 @@ from pathlib import Path
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
-# Known problematic sites that need urllib3 first
+# Known problematic sites that need urllib3 first; compiled once so each
+# check is a single C-level scan instead of a Python substring loop
 PROBLEMATIC_SITES = ["github.com", "api.github.com", "raw.githubusercontent.com"]
+PROBLEMATIC_SITES_RE = re.compile("|".join(re.escape(site) for site in PROBLEMATIC_SITES))
 
+# Advertise brotli only when a decoder is installed, otherwise stick to gzip/deflate
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+# Shared session so probes to the same host reuse one TCP/TLS connection;
+# the adapter pools are sized for the concurrently probed sites
+SESSION = requests.Session()
+SESSION.headers["Accept-Encoding"] = ACCEPT_ENCODING
+_adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
+# Cap on simultaneous probes, matched to the adapter pool size above
+PROBE_CONCURRENCY = 4
+
+# Silence the insecure-request warning once and reuse one Timeout object
+# instead of rebuilding both on every urllib3 probe
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+URLLIB3_TIMEOUT = urllib3.Timeout(connect=10.0, read=10.0)
+
+# One PoolManager for all urllib3 probes; it keeps a per-host connection pool
+# internally, so repeat probes of the same host skip the TCP/TLS handshake
+HTTP = urllib3.PoolManager(cert_reqs='CERT_NONE', assert_hostname=False, timeout=URLLIB3_TIMEOUT)
+
+@functools.lru_cache(maxsize=None)
 def setup_ssl():
-    """Look for SSL certificate and configure it if found."""
+    """Look for SSL certificate and configure it if found.
+
+    Memoized so importing callers don't repeat the Path build, the stat
+    and the environment mutation on every invocation.
+    """
     script_dir = Path(__file__).parent
     cert_path = script_dir / "ssl_certs" / "rbc-ca-bundle.cer"
     
     if cert_path.exists():
-        logger.info(f"Found SSL certificate: {cert_path}")
+        logger.info("Found SSL certificate: %s", cert_path)
         os.environ["SSL_CERT_FILE"] = str(cert_path)
         os.environ["REQUESTS_CA_BUNDLE"] = str(cert_path)
         return str(cert_path)
@@ -34,55 +71,91 @@ def setup_ssl():
 
 def is_problematic_site(url):
     """Check if URL is known to have SSL certificate chain issues."""
-    return any(site in url for site in PROBLEMATIC_SITES)
+    return PROBLEMATIC_SITES_RE.search(url) is not None
 
 def fetch_with_requests(url):
-    """Fetch URL using requests with proper SSL."""
+    """Probe URL using requests with proper SSL."""
     try:
-        response = requests.get(url, timeout=10)
+        # HEAD is enough for a connectivity check and skips the body download
+        response = SESSION.head(url, timeout=10, allow_redirects=True)
+        if response.status_code in (405, 501):
+            # Server doesn't implement HEAD - fall back to a full GET
+            response = SESSION.get(url, timeout=10)
         return response.status_code, f"SUCCESS (requests)" if response.status_code == 200 else f"HTTP {response.status_code} (requests)"
     except Exception as e:
         return None, f"requests Error: {e}"
 
 def fetch_with_urllib3(url):
-    """Fetch URL using urllib3 with relaxed SSL validation."""
+    """Probe URL using urllib3 with relaxed SSL validation."""
     try:
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-        http = urllib3.PoolManager(cert_reqs='CERT_NONE', assert_hostname=False, timeout=urllib3.Timeout(connect=10.0, read=10.0))
-        response = http.request('GET', url)
+        response = HTTP.request('HEAD', url, headers={'Accept-Encoding': ACCEPT_ENCODING})
+        if response.status in (405, 501):
+            # Server doesn't implement HEAD - fall back to a full GET
+            response = HTTP.request('GET', url, headers={'Accept-Encoding': ACCEPT_ENCODING})
         return response.status, f"SUCCESS (urllib3)" if response.status == 200 else f"HTTP {response.status} (urllib3)"
     except Exception as e:
         return None, f"urllib3 Error: {e}"
 
+def _probe(url, prefer='requests'):
+    """Probe a URL with the preferred fetcher, falling back to the other one.
+
+    Requests-first probes only fall back on SSL errors; urllib3-first probes
+    (known problematic sites) fall back on any non-200 outcome.
+    """
+    fetchers = {'requests': fetch_with_requests, 'urllib3': fetch_with_urllib3}
+    fallback = 'urllib3' if prefer == 'requests' else 'requests'
+
+    status, result = fetchers[prefer](url)
+    if status == 200:
+        return result
+    if prefer == 'requests' and not (status is None and "SSL" in result):
+        return result
+
+    logger.info("  %s failed, trying %s fallback...", prefer, fallback)
+    status2, result2 = fetchers[fallback](url)
+    if status2 == 200:
+        return f"{result2} (after {prefer} failed)"
+    return f"{result} | {result2}"
+
 def test_url(url):
     """Test a single URL with smart SSL approach."""
-    logger.info(f"Testing: {url}")
-    
-    if is_problematic_site(url):
-        # Known problematic: try urllib3 first, fallback to requests
-        status, result = fetch_with_urllib3(url)
-        if status != 200:
-            logger.info("  urllib3 failed, trying requests fallback...")
-            status2, result2 = fetch_with_requests(url)
-            if status2 == 200:
-                result = result2 + " (after urllib3 failed)"
-            else:
-                result = f"{result} | {result2}"
-    else:
-        # Normal sites: try requests first, fallback to urllib3 on SSL errors
-        status, result = fetch_with_requests(url)
-        if status is None and "SSL" in result:
-            logger.info("  requests SSL error, trying urllib3 fallback...")
-            status2, result2 = fetch_with_urllib3(url)
-            if status2 == 200:
-                result = result2 + " (after requests SSL error)"
-            else:
-                result = f"{result} | {result2}"
-    
+    logger.info("Testing: %s", url)
+
+    prefer = 'urllib3' if is_problematic_site(url) else 'requests'
+    result = _probe(url, prefer)
+
     success = "SUCCESS" in result
-    logger.info(f"  {'✓' if success else '✗'} {result}")
+    logger.info("  %s %s", '✓' if success else '✗', result)
     return success, result
 
+async def test_urls_concurrently(urls):
+    """Probe all URLs at once instead of one after the other.
+
+    The probes stay blocking (requests/urllib3) but run in worker threads,
+    so total wall time is roughly the slowest site rather than the sum.
+    """
+    # Eager tasks (Python 3.12+) start executing at creation instead of
+    # waiting for an event-loop roundtrip before their first step
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    semaphore = asyncio.Semaphore(PROBE_CONCURRENCY)
+
+    async def probe(url):
+        async with semaphore:
+            success, result = await asyncio.to_thread(test_url, url)
+        return url, success, result
+
+    results = {}
+    successful = 0
+    # as_completed hands back each probe as soon as it finishes, so results
+    # are recorded (and the slowest site doesn't gate the rest)
+    for future in asyncio.as_completed([probe(url) for url in urls]):
+        url, success, result = await future
+        results[url] = {"success": success, "result": result}
+        successful += success
+    return results, successful
+
 def main():
     print("=" * 60)
     print("WEB CONNECTIVITY TEST")
@@ -102,16 +175,21 @@ def main():
     print("\nTesting external website connectivity...")
     print("-" * 60)
     
-    results = {}
-    for url in test_urls:
-        success, result = test_url(url)
-        results[url] = {"success": success, "result": result}
+    # Run the probes on uvloop when it's installed; asyncio.Runner lets us
+    # pick the loop factory without touching the global event loop policy
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        results, successful_sites = runner.run(test_urls_concurrently(test_urls))
     
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
     
-    successful_sites = sum(1 for r in results.values() if r["success"])
     total_sites = len(results)
     
     print(f"SSL Certificate: {'Found' if cert_path else 'Not found (using system default)'}")